@@ -15,6 +15,16 @@ Design notes:
   timeouts) to keep scans readable.
 * Provide a -- timeout knob to avoid long waits on unresponsive
   nameservers.
+* Probe wordlist candidates concurrently with dnspython's asyncio resolver;
+  a fixed pool of workers (-- concurrency) caps how many queries are in
+  flight at once.
+* Stream the wordlist through a bounded queue instead of loading it into
+  memory, so probing starts immediately; the only per-word state kept is a
+  set of unique words used to skip duplicates.
+* Spread queries over a pool of public nameservers (-- resolvers) so no
+  single resolver's rate limit throttles long scans.
+* Detect wildcard DNS up front and drop answers that only repeat the
+  wildcard, so brute-force output lists real subdomains.
 * Add an optional -- verbose flag to help with troubleshooting/
   resolver insight
 
@@ -23,14 +33,78 @@ Ethics:
 """
 
 import argparse
+import asyncio
+import ipaddress
 import logging
-import socket
-from typing import List
+import secrets
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, Iterator, List
 
+import dns.asyncresolver
 import dns.resolver
+import dns.reversename
 import dns.exception
 
 
+# Default number of probe workers during wordlist brute-force. Unbounded
+# gather() over large wordlists exhausts sockets and tends to hang.
+DEFAULT_CONCURRENCY = 500
+
+# Public nameservers queries are rotated across (override with --resolvers).
+DEFAULT_NAMESERVERS = ["8.8.8.8", "1.1.1.1", "9.9.9.9", "8.8.4.4", "1.0.0.1"]
+
+# One answer cache shared by the whole pool, so repeated answers (shared
+# CNAME targets, re-probed names) come from memory whichever nameserver
+# originally served them.
+_CACHE = dns.resolver.LRUCache(10000)
+
+# Pool of async resolvers, one nameserver each. Built once so every probe
+# reuses the same configuration instead of re-reading system DNS settings
+# per lookup.
+RESOLVERS: List[dns.asyncresolver.Resolver] = []
+
+# PTR lookups keyed by IP. Sibling subdomains often share an address, so
+# each IP only needs to be reverse-resolved once per run. Tasks are stored
+# (not results) so concurrent probes for the same IP share one query.
+_PTR_CACHE: Dict[str, "asyncio.Task[str]"] = {}
+
+# Digit suffixes tried in numeric mode (api0..api9).
+DIGITS = ("0", "1", "2", "3", "4", "5", "6", "7", "8", "9")
+
+# Number of random labels resolved when checking for wildcard DNS.
+WILDCARD_PROBES = 3
+
+# IPs a wildcard record answers with for any label; set by detect_wildcard.
+WILDCARD_IPS: FrozenSet[str] = frozenset()
+
+
+def configure_resolvers(servers: List[str], timeout: float = 3.0) -> None:
+    """
+    (Re)build the resolver pool with one single-nameserver resolver per
+    server, all sharing the module-level answer cache.
+    """
+    pool = []
+    for srv in servers:
+        resolver = dns.asyncresolver.Resolver(configure=False)
+        resolver.nameservers = [srv]
+        resolver.lifetime = timeout
+        resolver.timeout = timeout
+        resolver.cache = _CACHE
+        pool.append(resolver)
+    RESOLVERS[:] = pool
+
+
+def pick_resolver(name: str) -> dns.asyncresolver.Resolver:
+    """
+    Choose the pool resolver for a query name. Hashing spreads load evenly
+    across the pool while keeping a given name on the same nameserver.
+    """
+    return RESOLVERS[hash(name) % len(RESOLVERS)]
+
+
+configure_resolvers(DEFAULT_NAMESERVERS)
+
+
 def setup_logging(verbose: bool) -> None:
     """
     Initialise logging.
@@ -46,30 +120,44 @@ def setup_logging(verbose: bool) -> None:
     )
 
 
-def reverse_dns(ip: str) -> str:
+async def reverse_dns(ip: str) -> str:
     """
     Attempt to obtain a PTR hostname for an IPV4 address.
 
     Returns:
         Hostname string (if present), or '' if no PTR or lookup fails.
 
-    Why use socket.gethostbyaddr?
-    - It's a simple, stdlib way to perform a reverse lookup.
-    - If you need timeout control or v6 support later, consider dnspython's
-      resolver for PTR as
+    Why use dnspython instead of socket.gethostbyaddr?
+    - gethostbyaddr blocks on the libc resolver and ignores --timeout.
+    - Going through the shared async resolver keeps PTR lookups concurrent
+      with A lookups and subject to the same timeout.
     """
+    task = _PTR_CACHE.get(ip)
+    if task is None:
+        task = asyncio.ensure_future(_lookup_ptr(ip))
+        _PTR_CACHE[ip] = task
+    # Shield so one cancelled waiter doesn't cancel the lookup for the rest.
+    return await asyncio.shield(task)
+
+
+async def _lookup_ptr(ip: str) -> str:
+    """
+    Query the PTR record for an IP; '' if there is none or it fails.
+    """
+    host = ""
     try:
-        host, _, _ = socket.gethostbyaddr(ip)
-        logging.debug(f"[debug] PTR lookup for {ip} -> {host}")
-        return host
-    except Exception as e:
+        name = dns.reversename.from_address(ip)
+        answers = await pick_resolver(ip).resolve(name, "PTR")
+        host = str(answers[0]).rstrip(".")
+        logging.debug("[debug] PTR lookup for %s -> %s", ip, host)
+    except dns.exception.DNSException as e:
         # PTR records are optional; lots of IPs wont have them. Avoid noisy
         # tracebacks by default
-        logging.debug(f"[debug] PTR lookup failed for {ip}: {e}")
-        return ""
+        logging.debug("[debug] PTR lookup failed for %s: %s", ip, e)
+    return host
 
 
-def resolve_a(domain: str, timeout: float = 3.0) -> List[str]:
+async def resolve_a(domain: str, timeout: float = 3.0) -> List[str]:
     """
     Resolve A records for a FQDN
 
@@ -82,74 +170,185 @@ def resolve_a(domain: str, timeout: float = 3.0) -> List[str]:
         Timeout, or resolver
     """
     try:
-        # Create a fresh resolver so per-call timeouts are reliable.
-        resolver = dns.resolver.Resolver()
+        resolver = pick_resolver(domain)
         resolver.lifetime = timeout     # overall operation budget
         resolver.timeout = timeout      # per-try budget
-        # NOTE: You can set resolver.nameservers = ['8.8.8.8', '1.1.1.1'] to 
-        # override system DNS.
-        answers = resolver.resolve(domain, "A")
+        answers = await resolver.resolve(domain, "A")
         ips = [a.to_text() for a in answers]
-        logging.debug(f"[debug] A lookup for {domain} -> {ips}")
+        logging.debug("[debug] A lookup for %s -> %s", domain, ips)
         return ips
     except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
         logging.debug(
-            f"[debug] No A record for {domain}: {e.__class__.__name__}"
+            "[debug] No A record for %s: %s", domain, e.__class__.__name__
         )
         return []
     except dns.resolver.NoNameservers as e:
-        logging.debug(f"[debug] No nameservers responded for {domain}: {e}")
+        logging.debug("[debug] No nameservers responded for %s: %s", domain, e)
         return []
     except dns.exception.Timeout:
-        logging.debug(f"[debug] Timeout resolving {domain} (>{timeout}s)")
+        logging.debug("[debug] Timeout resolving %s (>%ss)", domain, timeout)
         return []
 
 
-def probe(domain: str, timeout: float = 3.0) -> None:
+async def probe(domain: str, timeout: float = 3.0) -> None:
     """
     Resolve a domain and print human-friendly output for A + PTR.
 
     This is intentionally side-effect-y (prints) to keep CLI simple.
     If you want to export JSON/CSV later, split printing form data collection
     """
-    ips = resolve_a(domain, timeout=timeout)
+    ips = await resolve_a(domain, timeout=timeout)
     if not ips:
         return
+    if WILDCARD_IPS and set(ips) <= WILDCARD_IPS:
+        logging.debug("[debug] %s only matches the wildcard, skipping", domain)
+        return
 
-    for ip in ips:
+    ptrs = await asyncio.gather(*(reverse_dns(ip) for ip in ips))
+
+    # Print only once every lookup is done so concurrent probes don't
+    # interleave their lines.
+    for ip, ptr in zip(ips, ptrs):
         print(f"[+] A: {domain} -> {ip}")
-        ptr = reverse_dns(ip)
         if ptr:
             print(f"  PTR: {ptr}")
 
 
-def iterate_wordlist(domain: str, words: List[str], add_numeric: bool, timeout: float) -> None:
+async def detect_wildcard(domain: str, timeout: float = 3.0) -> FrozenSet[str]:
     """
-    Brute-force subdomains using a list of words.
-    Optionally try word + digits [0-9] (e.g., 'api1.example.com)
+    Check whether the domain has a wildcard record by resolving a few random
+    labels that should not exist.
+
+    If at least two of them resolve to the same non-empty IP set, that set is
+    stored in WILDCARD_IPS so probe() can drop answers it already explains.
+
+    Returns:
+        The wildcard IP set, or an empty frozenset if none was detected.
+    """
+    global WILDCARD_IPS
+
+    labels = [secrets.token_hex(6) for _ in range(WILDCARD_PROBES)]
+    answers = await asyncio.gather(
+        *(resolve_a(f"{label}.{domain}", timeout=timeout) for label in labels)
+    )
+    counts = Counter(frozenset(ips) for ips in answers if ips)
+
+    WILDCARD_IPS = frozenset()
+    if counts:
+        ips, hits = counts.most_common(1)[0]
+        if hits >= 2:
+            WILDCARD_IPS = ips
+            logging.debug("[debug] wildcard detected: %s", sorted(ips))
+    return WILDCARD_IPS
+
+
+def iter_candidates(domain: str, words: Iterable[str], add_numeric: bool) -> Iterator[str]:
+    """
+    Lazily yield candidate FQDNs for each wordlist entry.
+
+    Each FQDN is yielded at most once, so duplicate words (common in merged
+    wordlists, compared case-insensitively like DNS does) and overlaps like
+    'api1' vs 'api' + '1' cost no extra queries. Only unique words are
+    remembered, not every generated name.
 
     Args:
         domain: Base domain (example.com)
-        words: List of candidate subdomain labels (e.g.,
-            ['www', 'api', 'staging'])
-        add_numeric: Whether to also try suffixes 0-9 for each word
-        timeout: DNS timeout
+        words: Iterable of candidate subdomain labels, e.g. an open file
+        add_numeric: Whether to also yield suffixes 0-9 for each word
     """
+    # Hot path: runs up to 11x per word, so build names by concatenation
+    # against a precomputed suffix rather than formatting each one.
+    suffix = "." + domain
+    seen = set()
     for raw in words:
-        word = raw.strip()
-        # Skip empty lines and commented rows to tolerate common wordlists.
-        if not word or word.startswith("#"):
+        # DNS names are case-insensitive; 'WWW' and 'www' are one query.
+        word = raw.strip().lower()
+        # Skip empty lines, commented rows and repeats to tolerate common
+        # (and merged) wordlists.
+        if not word or word.startswith("#") or word in seen:
             continue
 
-        # Try the plain work first (www.example.com)
-        sub = f"{word}.{domain}"
-        probe(sub, timeout=timeout)
+        # Try the plain work first (www.example.com), unless an earlier
+        # word already covered it as a numeric suffix (api + 1 -> api1)
+        if not (add_numeric and word[-1] in DIGITS and word[:-1] in seen):
+            yield word + suffix
 
-        # Optionally try numeric suffixes (api0..api9)
+        # Optionally try numeric suffixes (api0..api9), skipping any that
+        # an earlier word already covered as its plain name
         if add_numeric:
-            for i in range(10):
-                sub_n = f"{word}{i}.{domain}"
-                probe(sub_n, timeout=timeout)
+            for d in DIGITS:
+                if word + d not in seen:
+                    yield word + d + suffix
+
+        seen.add(word)
+
+
+async def iterate_wordlist(domain: str, words: Iterable[str], add_numeric: bool, timeout: float,
+                           concurrency: int = DEFAULT_CONCURRENCY) -> None:
+    """
+    Brute-force subdomains using an iterable of words.
+    Optionally try word + digits [0-9] (e.g., 'api1.example.com)
+
+    Candidates flow through a bounded queue to `concurrency` workers, so the
+    wordlist is only read as fast as probes complete.
+
+    Args:
+        domain: Base domain (example.com)
+        words: Iterable of candidate subdomain labels (e.g., an open
+            wordlist file or ['www', 'api', 'staging'])
+        add_numeric: Whether to also try suffixes 0-9 for each word
+        timeout: DNS timeout
+        concurrency: Number of probes in flight
+    """
+    await detect_wildcard(domain, timeout=timeout)
+
+    queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=2 * concurrency)
+
+    async def worker() -> None:
+        while True:
+            sub = await queue.get()
+            try:
+                await probe(sub, timeout=timeout)
+            except Exception as e:
+                # One bad probe must not take a worker down with it.
+                logging.debug("[debug] probe failed for %s: %s", sub, e)
+            finally:
+                queue.task_done()
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    try:
+        for sub in iter_candidates(domain, words, add_numeric):
+            await queue.put(sub)
+        await queue.join()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def run(args: argparse.Namespace) -> None:
+    """
+    Run the root-domain probe, then the optional wordlist brute-force.
+    """
+    # Always probe the root domain first
+    await probe(args.domain, timeout=args.timeout)
+
+    if args.wordlist:
+        try:
+            f = open(args.wordlist, "r", encoding="utf-8")
+        except FileNotFoundError:
+            print(f"[!] Wordlist not found: {args.wordlist}")
+            return
+        # Pass the file handle itself so words are read line by line.
+        with f:
+            logging.debug("[debug] streaming words from %s", args.wordlist)
+            await iterate_wordlist(
+                args.domain,
+                f,
+                args.numeric,
+                timeout=args.timeout,
+                concurrency=args.concurrency
+            )
 
 
 def main() -> None:
@@ -168,31 +367,31 @@ def main() -> None:
                         help="Also try numeric suffixes 0-9 for each word")
     parser.add_argument("--timeout", type=float, default=3.0,
                         help="DNS resolver timeout (seconds)")
+    parser.add_argument("--resolvers",
+                        default=",".join(DEFAULT_NAMESERVERS),
+                        help="Comma-separated nameservers to rotate queries "
+                             "across (e.g., 8.8.8.8,1.1.1.1)")
+    parser.add_argument("--concurrency", type=int,
+                        default=DEFAULT_CONCURRENCY,
+                        help="Maximum number of DNS probes in flight")
     parser.add_argument("-v", "--verbose", action="store_true",
                         help="Enable verbose debug logs")
     args = parser.parse_args()
 
-    setup_logging(args.verbose)
-
-    # Always probe the root domain first
-    probe(args.domain, timeout=args.timeout)
-
-    if args.wordlist:
+    servers = [s.strip() for s in args.resolvers.split(",") if s.strip()]
+    if not servers:
+        parser.error("--resolvers needs at least one nameserver")
+    for srv in servers:
         try:
-            with open(args.wordlist, "r", encoding="utf-8") as f:
-                words = f.read().splitlines()
-            logging.debug(
-                f"[debug] loaded {len(words)} words from {args.wordlist}"
-            )
-        except FileNotFoundError:
-            print(f"[!] Wordlist not found: {args.wordlist}")
-            return
-        iterate_wordlist(
-            args.domain,
-            words,
-            args.numeric,
-            timeout=args.timeout
-        )
+            ipaddress.ip_address(srv)
+        except ValueError:
+            parser.error(f"--resolvers: not an IP address: {srv!r}")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    setup_logging(args.verbose)
+    configure_resolvers(servers, timeout=args.timeout)
+    asyncio.run(run(args))
 
 
 if __name__ == "__main__":
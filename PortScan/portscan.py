@@ -6,39 +6,231 @@
     1. TCP SYN scans on common
     2. A UDP DNS scan to see if the target is responding to DNS requests.
 
+    On Linux the SYN scan skips Scapy and writes pre-built TCP headers to
+    a raw socket, which is far cheaper than building packets in Scapy.
+
     Author: Felix1862
 
 """
 
 import argparse
-from scapy.all import IP, TCP, UDP, DNS, DNSQR, sr
+import random
+import select
+import socket
+import struct
+import sys
+import time
+from scapy.all import IP, TCP, UDP, DNS, DNSQR, conf
+from scapy.sendrecv import sndrcv
 
 
 # List of common ports to scan
 ports = [25, 80, 53, 443, 445, 8080, 8443]
 
+# Source port used for the SYN probes
+SRC_PORT = 5555
+
+# Seconds to wait for replies; roughly the slowest RTT worth waiting for
+TIMEOUT = 0.5
+
+# TCP flag bits
+SYN = 0x02
+SYN_ACK = 0x12
+
 
-def SynScan(host):
+def _checksum(data):
     """
-    Performs a TCP SYN scan on the specified host over the ports list.
+    Computes the Internet checksum (RFC 1071): the ones' complement of the
+    ones' complement sum of the data's 16-bit words.
+
+    Args:
+        data (bytes): Data to checksum.
+
+    Returns:
+        int: 16-bit checksum.
+    """
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    while total >> 16:
+        total = (total & 0xFFFF) + (total >> 16)
+    return ~total & 0xFFFF
+
+
+def _update_checksum(csum, old_word, new_word):
+    """
+    Incrementally updates an Internet checksum after one 16-bit word of
+    the data changed from old_word to new_word (RFC 1624, eqn. 3):
+    HC' = ~(~HC + ~m + m').
+
+    Args:
+        csum (int): Current checksum.
+        old_word (int): Previous value of the changed word.
+        new_word (int): New value of the changed word.
+
+    Returns:
+        int: Updated 16-bit checksum.
+    """
+    total = (~csum & 0xFFFF) + (~old_word & 0xFFFF) + new_word
+    total = (total & 0xFFFF) + (total >> 16)
+    total = (total & 0xFFFF) + (total >> 16)
+    return ~total & 0xFFFF
+
+
+def _local_ip_for(dst):
+    """
+    Finds the source address the kernel would use to reach dst. Connecting a
+    UDP socket sends nothing; it only selects a route.
+
+    Args:
+        dst (str): Destination IPv4 address.
+
+    Returns:
+        str: Local IPv4 address.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.connect((dst, 53))
+        return s.getsockname()[0]
+
+
+def _build_syn_segments(src, dst, dports, seq):
+    """
+    Builds one 20-byte TCP SYN header per destination port from a single
+    template, patching just the port and checksum each time. The template
+    is checksummed once; since only the port word differs per probe, each
+    probe's checksum is an incremental update of that one.
+
+    Args:
+        src (str): Source IPv4 address (for the checksum pseudo-header).
+        dst (str): Destination IPv4 address.
+        dports (list[int]): Destination ports.
+        seq (int): Initial sequence number to put in every probe.
+
+    Returns:
+        list[tuple[int, bytes]]: (port, segment) pairs ready to send.
+    """
+    template = bytearray(struct.pack(
+        "!HHIIBBHHH",
+        SRC_PORT, 0,        # source port, destination port (patched)
+        seq, 0,             # sequence number, ack number
+        5 << 4, SYN,        # data offset (5 words), flags
+        64240, 0, 0         # window, checksum (patched), urgent pointer
+    ))
+    pseudo = (socket.inet_aton(src) + socket.inet_aton(dst) +
+              struct.pack("!BBH", 0, socket.IPPROTO_TCP, len(template)))
+
+    # Checksum of the template with destination port 0
+    base_csum = _checksum(pseudo + template)
+
+    segments = []
+    for dport in dports:
+        csum = _update_checksum(base_csum, 0, dport)
+        struct.pack_into("!H", template, 2, dport)
+        struct.pack_into("!H", template, 16, csum)
+        segments.append((dport, bytes(template)))
+    return segments
+
+
+def _raw_syn_scan(host, dports, timeout=TIMEOUT):
+    """
+    SYN-scans host with a raw TCP socket (Linux only, needs root).
+
+    The kernel adds the IP header; replies arrive on the same socket as full
+    IP packets and are matched on source address, ports, SYN-ACK flags and
+    the acknowledged sequence number.
+
+    Args:
+        host (str): Target IP address or domain.
+        dports (list[int]): Ports to probe.
+        timeout (float): Seconds to wait for replies after sending.
+
+    Returns:
+        list[int]: Open ports, sorted.
+    """
+    dst = socket.gethostbyname(host)
+    dst_bytes = socket.inet_aton(dst)
+    seq = random.getrandbits(32)
+    segments = _build_syn_segments(_local_ip_for(dst), dst, dports, seq)
+
+    wanted = set(dports)
+    open_ports = set()
+    with socket.socket(socket.AF_INET, socket.SOCK_RAW,
+                       socket.IPPROTO_TCP) as raw:
+        for _, segment in segments:
+            raw.sendto(segment, (dst, 0))
+
+        deadline = time.monotonic() + timeout
+        while wanted - open_ports:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            ready, _, _ = select.select([raw], [], [], remaining)
+            if not ready:
+                break
+            packet = raw.recv(65535)
+
+            ihl = (packet[0] & 0x0F) * 4
+            if packet[12:16] != dst_bytes or len(packet) < ihl + 14:
+                continue
+            sport, dport, _, ack, _, flags = struct.unpack_from(
+                "!HHIIBB", packet, ihl
+            )
+            if (dport == SRC_PORT and sport in wanted
+                    and flags & SYN_ACK == SYN_ACK
+                    and ack == (seq + 1) & 0xFFFFFFFF):
+                open_ports.add(sport)
+
+    return sorted(open_ports)
+
+
+def _scapy_syn_scan(host, sock, timeout=TIMEOUT):
+    """
+    SYN-scans host through Scapy on the shared L3 socket. Used where raw
+    TCP sockets aren't available (e.g. Windows).
 
     Args:
         host (str): The target IP address.
+        sock (SuperSocket): Open L3 socket to send and receive on.
+        timeout (float): Seconds to wait for replies after sending.
 
+    Returns:
+        list[int]: Open ports.
     """
-    print(f"[*] Starting SYN scan on {host}")
     # Craft IP and TCP packets with SYN flag set to scan ports
-    ans, unans = sr(
-        IP(dst=host) / TCP(sport=5555, dport=ports, flags="S"),
-        timeout=2,
-        verbose=0
+    ans, unans = sndrcv(
+        sock,
+        IP(dst=host) / TCP(sport=SRC_PORT, dport=ports, flags="S"),
+        timeout=timeout,
+        verbose=0,
+        # Receive in a background thread while still sending
+        threaded=True
     )
 
     open_ports = []
     for sent, received in ans:
-        # If we get a SYN-ACK back, means the port is open
-        if sent[TCP].dport == received[TCP].sport:
-            open_ports.append(sent[TCP].dport)
+        # If we get a SYN-ACK back (not a RST), means the port is open
+        if (sent[TCP].dport == received[TCP].sport
+                and received[TCP].flags & SYN_ACK == SYN_ACK):
+            open_ports.append(received[TCP].sport)
+    return sorted(open_ports)
+
+
+def SynScan(host, sock, timeout=TIMEOUT):
+    """
+    Performs a TCP SYN scan on the specified host over the ports list.
+
+    Args:
+        host (str): The target IP address.
+        sock (SuperSocket): Open L3 socket, used when raw sockets
+            aren't available.
+        timeout (float): Seconds to wait for replies.
+
+    """
+    print(f"[*] Starting SYN scan on {host}")
+    if sys.platform.startswith("linux"):
+        open_ports = _raw_syn_scan(host, ports, timeout)
+    else:
+        open_ports = _scapy_syn_scan(host, sock, timeout)
 
     if open_ports:
         print(f"[+] Open ports at {host}: {open_ports}")
@@ -46,21 +238,26 @@ def SynScan(host):
         print(f"[-] No open ports found on {host}.")
 
 
-def DNSScan(host):
+def DNSScan(host, sock, timeout=TIMEOUT):
     """
     Sends a DNS query over UDP to port 53 to see if the target as a DNS
 
     Args:
         host (str): The target IP address
+        sock (SuperSocket): Open L3 socket to send and receive on.
+        timeout (float): Seconds to wait for a reply.
 
     """
     print(f"[*] Starting DNS scan on {host}")
     # Craft UDP packet with DNS query for 'google.com'
-    ans, unans = sr(
-        IP(dst=host) / UDP(sport=5555, dport=53) /
+    ans, unans = sndrcv(
+        sock,
+        IP(dst=host) / UDP(sport=SRC_PORT, dport=53) /
         DNS(rd=1, qd=DNSQR(qname="google.com")),
-        timeout=2,
-        verbose=0
+        timeout=timeout,
+        verbose=0,
+        # Receive in a background thread while still sending
+        threaded=True
     )
 
     if ans:
@@ -83,13 +280,31 @@ if __name__ == "__main__":
         help="Target IP address or domain to scan"
     )
 
+    # Optional --timeout to wait longer on slow or distant hosts
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=TIMEOUT,
+        help=f"Seconds to wait for replies (default: {TIMEOUT})"
+    )
+
     # Parse the command-line arguments
     args = parser.parse_args()
 
     # Extract the host value
     host = args.host
 
+    # We only need replies addressed to us, not everything on the wire
+    conf.sniff_promisc = False
+
+    # Open one L3 socket up front and share it between both scans, rather
+    # than letting each sr() call bind and configure its own
+    sock = conf.L3socket()
+
     # Run the scans on the provided host
     print(f"[*] Starting scans on {host}")
-    SynScan(host)
-    DNSScan(host)
+    try:
+        SynScan(host, sock, args.timeout)
+        DNSScan(host, sock, args.timeout)
+    finally:
+        sock.close()
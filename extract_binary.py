@@ -15,6 +15,87 @@ GitHub: https://github.com/Felix1862
 License: MIT
 """
 
+import mmap
+import os
+import re
+import warnings
+
+import numpy as np
+
+# Bytes of the memory-mapped dump handed to NumPy per parse
+CHUNK_SIZE = 1 << 20
+
+# Bytes that can be part of a token (word characters plus . & -); chunks
+# are only cut after a byte outside this set
+_TOKEN_BYTES = frozenset(
+    b"0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_.&-"
+)
+
+# Whole (optionally negative) decimal tokens, i.e. the candidate byte
+# values in a dump. Digits inside other tokens (1.5, &H4D, objFile2) are
+# not values; negatives are kept so the range check can report them.
+_DECIMAL_RE = re.compile(rb"(?<![\w.&-])-?\d+(?![\w.])")
+
+
+def _iter_chunks(mm: mmap.mmap, size: int = CHUNK_SIZE):
+    """
+    Yields consecutive slices of roughly `size` bytes from a memory-mapped
+    dump, cutting only between tokens so no value is split across chunks.
+
+    Args:
+        mm (mmap.mmap): Memory-mapped input file.
+        size (int): Target chunk size in bytes.
+
+    Yields:
+        bytes: The next slice of the dump.
+    """
+    start, total = 0, len(mm)
+    while start < total:
+        end = min(start + size, total)
+        if end < total:
+            # Back off to the last separator so a token isn't cut in two
+            cut = end
+            while cut > start and mm[cut - 1] in _TOKEN_BYTES:
+                cut -= 1
+            if cut > start:
+                end = cut
+        yield mm[start:end]
+        start = end
+
+
+def _parse_chunk(chunk: bytes) -> np.ndarray:
+    """
+    Parses the decimal values in one chunk of a dump.
+
+    Clean dumps (only numbers and whitespace) are parsed by NumPy in a
+    single C pass. NumPy stops at the first token it can't read (a comma,
+    a VBA keyword, ...), warning on older versions and raising on newer
+    ones; only then is the chunk re-scanned with _DECIMAL_RE so stray
+    tokens are skipped.
+
+    Args:
+        chunk (bytes): Slice of the dump from _iter_chunks.
+
+    Returns:
+        numpy.ndarray: The parsed values as int64.
+    """
+    # NumPy reads a whitespace-only string as a single 0
+    if chunk.isspace():
+        return np.empty(0, dtype=np.int64)
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', DeprecationWarning)
+            return np.fromstring(chunk, dtype=np.int64, sep=' ')
+    except (DeprecationWarning, ValueError):
+        pass
+
+    tokens = _DECIMAL_RE.findall(chunk)
+    if not tokens:
+        return np.empty(0, dtype=np.int64)
+    return np.fromstring(b' '.join(tokens), dtype=np.int64, sep=' ')
+
+
 def extract_binary_from_writebytes(input_file: str, output_file: str) -> None:
     """
     Extracts and reconstructs a binary file from decimal byte values
@@ -28,24 +109,32 @@ def extract_binary_from_writebytes(input_file: str, output_file: str) -> None:
         None
     """
     try:
-        # Open and read the input file (e.g., dump_data.txt)
-        with open(input_file, 'r') as f:
-            # Join lines into one string, separating values with space
-            content = f.read().replace('\n', ' ')
+        # Map the input file (e.g., dump_data.txt) instead of reading it into
+        # memory, and stream the bytes to the output file chunk by chunk
+        skipped = 0
+        with open(input_file, 'rb') as f, open(output_file, 'wb') as out:
+            # mmap refuses empty files; an empty dump is an empty binary
+            if os.fstat(f.fileno()).st_size:
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
 
-        # Convert each valid decimal string to an integer (byte)
-        byte_values = [int(b) for b in content.split() if b.isdigit()]
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for chunk in _iter_chunks(mm):
+                        values = _parse_chunk(chunk)
 
-        # Write the byte values to a binary output file
-        with open(output_file, 'wb') as out:
-            out.write(bytearray(byte_values))
+                        # Keep only values that fit in a byte; one vectorised
+                        # mask instead of a per-value bounds check, counting
+                        # negatives and values over 255 as skipped
+                        ok = (values >= 0) & (values <= 255)
+                        skipped += int((~ok).sum())
+                        out.write(values[ok].astype(np.uint8).tobytes())
 
+        if skipped:
+            print(f"[!] Skipped {skipped} out-of-range values (not 0-255).")
         print(f"[+] Binary written to {output_file}")
 
     except FileNotFoundError:
         print(f"[!] File not found: {input_file}")
-    except ValueError:
-        print("[!] Malformed byte values detected. Ensure only integers are present.")
     except Exception as e:
         print(f"[!] Unexpected error: {e}")
 
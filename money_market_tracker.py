@@ -18,42 +18,71 @@ License: MIT
 """
 
 import sqlite3
+import time
 from datetime import datetime
+from functools import lru_cache
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 
 # Constants for interest rates
 OAK_RATE = 0.1864
 MANSAX_RATE = 0.1956
 
+# Row layout of a 25-year projection (one record per year)
+PROJECTION_DTYPE = np.dtype([
+    ("Year", "i4"),
+    ("Interest", "f8"),
+    ("Topup", "f8"),
+    ("Withdrawn", "f8"),
+    ("Remaining", "f8"),
+])
+
+# Exchange rate API settings
+EXCHANGE_RATE_URL = "https://api.exchangerate.host/latest?base=KES&symbols=GBP"
+FALLBACK_KES_GBP_RATE = 0.0058
+EXCHANGE_RATE_TIMEOUT = (3.05, 5)   # (connect, read) seconds
+EXCHANGE_RATE_CACHE_MINUTES = 10
+
+# Shared HTTP session so repeated calls reuse the pooled TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
 # SQLite setup
 db = sqlite3.connect("investment_tracker.db")
 cursor = db.cursor()
 
-# Recreate MMF_Combined table
-cursor.execute("DROP TABLE IF EXISTS MMF_Combined")
-cursor.execute("""
-    CREATE TABLE MMF_Combined (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        currency TEXT,
-        provider_oak TEXT,
-        provider_mansax TEXT,
-        invest_oak REAL,
-        invest_mansax REAL,
-        start_month_oak TEXT,
-        start_year_oak INTEGER,
-        start_month_mansax TEXT,
-        start_year_mansax INTEGER,
-        investment_type TEXT,
-        monthly_invest_months INTEGER,
-        annual_topup_oak REAL,
-        annual_topup_mansax REAL,
-        investment_duration INTEGER,
-        interest_withdraw_start_year INTEGER,
-        oak_withdraw_amount REAL,
-        mansax_withdraw_amount REAL
-    )
-""")
-db.commit()
+# WAL with synchronous=NORMAL only syncs at checkpoints, not every commit
+cursor.execute("PRAGMA journal_mode=WAL")
+cursor.execute("PRAGMA synchronous=NORMAL")
+
+# Recreate MMF_Combined table in one transaction. DDL doesn't open a
+# transaction implicitly, hence BEGIN.
+with db:
+    cursor.execute("BEGIN")
+    cursor.execute("DROP TABLE IF EXISTS MMF_Combined")
+    cursor.execute("""
+        CREATE TABLE MMF_Combined (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            currency TEXT,
+            provider_oak TEXT,
+            provider_mansax TEXT,
+            invest_oak REAL,
+            invest_mansax REAL,
+            start_month_oak TEXT,
+            start_year_oak INTEGER,
+            start_month_mansax TEXT,
+            start_year_mansax INTEGER,
+            investment_type TEXT,
+            monthly_invest_months INTEGER,
+            annual_topup_oak REAL,
+            annual_topup_mansax REAL,
+            investment_duration INTEGER,
+            interest_withdraw_start_year INTEGER,
+            oak_withdraw_amount REAL,
+            mansax_withdraw_amount REAL
+        )
+    """)
 
 
 def validate_float_input(prompt):
@@ -121,6 +150,22 @@ def validate_str_input(prompt, options=None):
             return value
 
 
+@lru_cache(maxsize=1)
+def _fetch_exchange_rate(time_bucket):
+    """
+    Fetch the KES to GBP rate from the API, cached per time bucket.
+
+    Args:
+        time_bucket (int): Cache key; changes every
+            EXCHANGE_RATE_CACHE_MINUTES so the rate is refreshed.
+
+    Returns:
+        float: Exchange rate.
+    """
+    response = _SESSION.get(EXCHANGE_RATE_URL, timeout=EXCHANGE_RATE_TIMEOUT)
+    return response.json()["rates"]["GBP"]
+
+
 def get_current_exchange_rate():
     """
     Fetch the current exchange rate from KES to GBP.
@@ -129,13 +174,13 @@ def get_current_exchange_rate():
         float: Exchange rate or fallback value.
     """
     try:
-        response = requests.get(
-            "https://api.exchangerate.host/latest?base=KES&symbols=GBP"
+        # Failures raise out of the cached call, so they are never cached
+        return _fetch_exchange_rate(
+            int(time.time() // (EXCHANGE_RATE_CACHE_MINUTES * 60))
         )
-        return response.json()["rates"]["GBP"]
     except Exception as e:
         print("Error fetching exchange rate:", e)
-        return 0.0058
+        return FALLBACK_KES_GBP_RATE
 
 
 def calculate_projection_25_years(principal, rate, topup, withdraw_amount, lock_years):
@@ -150,26 +195,33 @@ def calculate_projection_25_years(principal, rate, topup, withdraw_amount, lock_
         lock_years (int): Number of years before withdrawal starts.
     
     Returns:
-        list[dict]: Yearly breakdown of the investment growth.
+        numpy.ndarray: Yearly breakdown of the investment growth, as a
+        structured array with PROJECTION_DTYPE fields.
     """
-    projection = []
+    years = np.arange(1, 26)
+    withdrawn = np.where(years > lock_years, withdraw_amount, 0.0)
+
+    # Step the recurrence b_n = b_(n-1) * (1 + r) + topup - w_n in the same
+    # order as the yearly calculation so the rounded figures match it
+    # exactly, filling preallocated columns instead of building row dicts.
+    interest = np.empty(25)
+    remaining = np.empty(25)
     balance = principal
-
-    for year in range(1, 26):
-        interest = balance * rate
-        withdrawn = 0 if year <= lock_years else withdraw_amount
-        balance += topup + interest
-        if year > lock_years:
-            balance -= withdrawn
-
-        projection.append({
-            "Year": year,
-            "Interest": round(interest, 2),
-            "Topup": round(topup, 2),
-            "Withdrawn": round(withdrawn, 2),
-            "Remaining": round(balance, 2)
-        })
-
+    for n in range(25):
+        year_interest = balance * rate
+        balance += topup + year_interest
+        balance -= float(withdrawn[n])
+        interest[n] = round(year_interest, 2)
+        remaining[n] = round(balance, 2)
+
+    projection = np.zeros(25, dtype=PROJECTION_DTYPE)
+    projection["Year"] = years
+    projection["Interest"] = interest
+    projection["Topup"] = round(topup, 2)
+    projection["Withdrawn"] = np.where(
+        years > lock_years, round(withdraw_amount, 2), 0.0
+    )
+    projection["Remaining"] = remaining
     return projection
 
 
@@ -186,8 +238,8 @@ def display_projection_summary(investment):
     )
     print("\n--- 25-Year Projection Summary ---")
 
-    oak_proj = []
-    mansax_proj = []
+    oak_proj = None
+    mansax_proj = None
 
     if investment['invest_oak'] > 0:
         oak_proj = calculate_projection_25_years(
@@ -210,7 +262,7 @@ def display_projection_summary(investment):
     for year in range(25):
         y = year + 1
 
-        if oak_proj:
+        if oak_proj is not None:
             label_oak = "(LOCKED)" if y <= lock_years else ""
             oak = oak_proj[year]
             print(
@@ -220,7 +272,7 @@ def display_projection_summary(investment):
                 f"Remaining: {oak['Remaining']:,.2f}"
             )
 
-        if mansax_proj:
+        if mansax_proj is not None:
             label_mansax = "(LOCKED)" if y <= lock_years else ""
             mx = mansax_proj[year]
             print(
@@ -230,7 +282,7 @@ def display_projection_summary(investment):
                 f"Remaining: {mx['Remaining']:,.2f}"
             )
 
-        if oak_proj and mansax_proj:
+        if oak_proj is not None and mansax_proj is not None:
             net = oak_proj[year]['Interest'] + mansax_proj[year]['Interest']
             wd = oak_proj[year]['Withdrawn'] + mansax_proj[year]['Withdrawn']
             retained = net - wd
@@ -239,7 +291,7 @@ def display_projection_summary(investment):
                 f"Combined Withdrawn: {wd:,.2f} | "
                 f"Retained Net Interest: {retained:,.2f}\n"
             )
-        elif oak_proj or mansax_proj:
+        elif oak_proj is not None or mansax_proj is not None:
             print()
 
 